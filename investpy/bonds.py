@@ -22,6 +22,8 @@ from .data.bonds_data import (
 from .utils.data import Data
 from .utils.extra import random_user_agent
 
+_NEGATIVE_VALUE_RE = re.compile(r"([\-]{1}[ ]{1}[0-9\.]+)+")
+
 
 def get_bonds(country=None):
     """
@@ -828,21 +830,18 @@ def get_bond_information(bond, as_json=False):
                     occ = text.count("-")
 
                     if occ == 1:
-                        reg = re.compile(r"([\-]{1}[ ]{1}[0-9\.]+)+")
-                        matches = reg.findall(text)
+                        matches = _NEGATIVE_VALUE_RE.findall(text)
                         if len(matches) > 0:
                             result.at[0, title_] = float(matches[0].replace(" ", ""))
                             continue
                     elif occ == 2:
-                        reg = re.compile(r"([\-]{1}[ ]{1}[0-9\.]+)+")
-                        matches = reg.findall(text)
+                        matches = _NEGATIVE_VALUE_RE.findall(text)
                         if len(matches) > 0:
                             res = matches[0].replace(" ", "")
                             result.at[0, title_] = " ".join([res, matches[1]])
                             continue
                     elif occ == 3:
-                        reg = re.compile(r"([\-]{1}[ ]{1}[0-9\.]+)+")
-                        matches = reg.findall(text)
+                        matches = _NEGATIVE_VALUE_RE.findall(text)
                         if len(matches) > 0:
                             res = list()
                             for match in matches:
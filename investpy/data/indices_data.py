@@ -2,6 +2,8 @@
 # See LICENSE for details.
 
 import json
+import os
+from functools import lru_cache
 
 import pandas as pd
 import pkg_resources
@@ -9,6 +11,43 @@ from unidecode import unidecode
 
 from ..utils import constant as cst
 
+_INDEX_COUNTRIES = frozenset(value["country_name"] for value in cst.INDEX_COUNTRIES)
+
+
+@lru_cache(maxsize=1)
+def _read_indices_csv(path, mtime):
+    indices = pd.read_csv(path, keep_default_na=False)
+
+    groups = indices.groupby("country", sort=False).indices
+
+    return indices, groups
+
+
+def _load_indices_df():
+    """
+    This function loads the `indices.csv` file from investpy just once, since the parsed :obj:`pandas.DataFrame`
+    is cached and just re-read if the file modification time changes. Note that the returned
+    :obj:`pandas.DataFrame` is shared between calls, so it should not be modified in place.
+
+    Returns:
+        :obj:`tuple` - indices, groups:
+            The resulting :obj:`pandas.DataFrame` contains all the indices information stored in `indices.csv`,
+            and the :obj:`dict` maps every country to the row positions of its indices.
+
+    Raises:
+        FileNotFoundError: raised if the `indices.csv` file was not found.
+
+    """
+
+    resource_package = "investpy"
+    resource_path = "/".join(("resources", "indices.csv"))
+    if not pkg_resources.resource_exists(resource_package, resource_path):
+        raise FileNotFoundError("ERR#0059: indices file not found or errored.")
+
+    path = pkg_resources.resource_filename(resource_package, resource_path)
+
+    return _read_indices_csv(path, os.path.getmtime(path))
+
 
 def indices_as_df(country=None):
     """
@@ -42,21 +81,12 @@ def indices_as_df(country=None):
     if country is not None and not isinstance(country, str):
         raise ValueError("ERR#0025: specified country value not valid.")
 
-    resource_package = "investpy"
-    resource_path = "/".join(("resources", "indices.csv"))
-    if pkg_resources.resource_exists(resource_package, resource_path):
-        indices = pd.read_csv(
-            pkg_resources.resource_filename(resource_package, resource_path),
-            keep_default_na=False,
-        )
-    else:
-        raise FileNotFoundError("ERR#0059: indices file not found or errored.")
+    indices, groups = _load_indices_df()
 
     if indices is None:
         raise IOError("ERR#0037: indices not found or unable to retrieve.")
 
-    indices.drop(columns=["tag", "id"], inplace=True)
-    indices = indices.where(pd.notnull(indices), None)
+    indices = indices.drop(columns=["tag", "id"])
 
     if country is None:
         indices.reset_index(drop=True, inplace=True)
@@ -64,12 +94,12 @@ def indices_as_df(country=None):
     else:
         country = unidecode(country.strip().lower())
 
-        if country not in index_countries_as_list():
+        if country not in _INDEX_COUNTRIES:
             raise ValueError(
                 "ERR#0034: country " + country + " not found, check if it is correct."
             )
 
-        indices = indices[indices["country"] == country]
+        indices = indices.take(groups.get(country, []))
         indices.reset_index(drop=True, inplace=True)
 
         return indices
@@ -105,33 +135,24 @@ def indices_as_list(country=None):
     if country is not None and not isinstance(country, str):
         raise ValueError("ERR#0025: specified country value not valid.")
 
-    resource_package = "investpy"
-    resource_path = "/".join(("resources", "indices.csv"))
-    if pkg_resources.resource_exists(resource_package, resource_path):
-        indices = pd.read_csv(
-            pkg_resources.resource_filename(resource_package, resource_path),
-            keep_default_na=False,
-        )
-    else:
-        raise FileNotFoundError("ERR#0059: indices file not found or errored.")
+    indices, groups = _load_indices_df()
 
     if indices is None:
         raise IOError("ERR#0037: indices not found or unable to retrieve.")
 
-    indices.drop(columns=["tag", "id"], inplace=True)
-    indices = indices.where(pd.notnull(indices), None)
+    indices = indices.drop(columns=["tag", "id"])
 
     if country is None:
         return indices["name"].tolist()
     else:
         country = unidecode(country.strip().lower())
 
-        if country not in index_countries_as_list():
+        if country not in _INDEX_COUNTRIES:
             raise ValueError(
                 "ERR#0034: country " + country + " not found, check if it is correct."
             )
 
-        return indices[indices["country"] == country]["name"].tolist()
+        return indices["name"].take(groups.get(country, [])).tolist()
 
 
 def indices_as_dict(country=None, columns=None, as_json=False):
@@ -182,21 +203,12 @@ def indices_as_dict(country=None, columns=None, as_json=False):
             "ERR#0002: as_json argument can just be True or False, bool type."
         )
 
-    resource_package = "investpy"
-    resource_path = "/".join(("resources", "indices.csv"))
-    if pkg_resources.resource_exists(resource_package, resource_path):
-        indices = pd.read_csv(
-            pkg_resources.resource_filename(resource_package, resource_path),
-            keep_default_na=False,
-        )
-    else:
-        raise FileNotFoundError("ERR#0059: indices file not found or errored.")
+    indices, groups = _load_indices_df()
 
     if indices is None:
         raise IOError("ERR#0037: indices not found or unable to retrieve.")
 
-    indices.drop(columns=["tag", "id"], inplace=True)
-    indices = indices.where(pd.notnull(indices), None)
+    indices = indices.drop(columns=["tag", "id"])
 
     if columns is None:
         columns = indices.columns.tolist()
@@ -221,21 +233,17 @@ def indices_as_dict(country=None, columns=None, as_json=False):
     else:
         country = unidecode(country.strip().lower())
 
-        if country not in index_countries_as_list():
+        if country not in _INDEX_COUNTRIES:
             raise ValueError(
                 "ERR#0034: country " + country + " not found, check if it is correct."
             )
 
+        indices = indices.take(groups.get(country, []))
+
         if as_json:
-            return json.dumps(
-                indices[indices["country"] == country][columns].to_dict(
-                    orient="records"
-                )
-            )
+            return json.dumps(indices[columns].to_dict(orient="records"))
         else:
-            return indices[indices["country"] == country][columns].to_dict(
-                orient="records"
-            )
+            return indices[columns].to_dict(orient="records")
 
 
 def index_countries_as_list():
@@ -2,17 +2,21 @@
 # See LICENSE for details.
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, timedelta
 from random import randint
 
 import pandas as pd
-import pkg_resources
 import pytz
 import requests
-from lxml.html import fromstring
+from lxml.etree import XPath
+from lxml.html import HTMLParser, fromstring
+from requests.adapters import HTTPAdapter
 from unidecode import unidecode
+from urllib3.util.retry import Retry
 
 from .data.indices_data import (
+    _load_indices_df,
     index_countries_as_list,
     indices_as_df,
     indices_as_dict,
@@ -21,6 +25,126 @@ from .data.indices_data import (
 from .utils.data import Data
 from .utils.extra import random_user_agent
 
+_TIMEOUT = (5, 30)
+
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=8,
+        pool_maxsize=32,
+        max_retries=Retry(
+            total=3,
+            connect=3,
+            read=2,
+            backoff_factor=0.5,
+            status_forcelist=[500, 502, 503, 504],
+            allowed_methods=frozenset(["GET"]),
+            raise_on_status=False,
+        ),
+    ),
+)
+_SESSION.headers.update(
+    {
+        "X-Requested-With": "XMLHttpRequest",
+        "Accept": "text/html",
+        "Accept-Encoding": "gzip, deflate",
+        "Connection": "keep-alive",
+    }
+)
+
+_MAX_WORKERS = 16
+
+_HTML_PARSER = HTMLParser(
+    encoding="utf-8", remove_blank_text=True, remove_comments=True
+)
+
+_URL_COUNTRY_ALIASES = {"united states": "usa", "united kingdom": "uk"}
+
+_FLAG_COUNTRY_ALIASES = {
+    "bosnia-herzegovina": "bosnia",
+    "palestinian territory": "palestine",
+    "united arab emirates": "dubai",
+    "cote d'ivoire": "ivory coast",
+}
+
+_PAIR_PREFIX = "pair_"
+_PAIR_PREFIX_LEN = len(_PAIR_PREFIX)
+
+_XP_KEY_INFO = XPath("//dl[@data-test='key-info']/div")
+_XP_NAME = XPath(".//td[contains(@class, 'elp')]/a")
+_XP_TD_CLASS_CONTAINS = XPath(".//td[contains(@class, $name)]")
+
+
+def _table_rows(root_, table_id):
+    """
+    This is an auxiliar function to retrieve the rows of the table with the specified id, walking the
+    children of its `tbody` instead of searching the whole tree for every row.
+
+    Returns:
+        :obj:`list` - rows:
+            The `tr` elements of the table body, or an empty :obj:`list` if the table was not found.
+
+    """
+
+    tbody = root_.find(".//table[@id='" + table_id + "']/tbody")
+
+    if tbody is None:
+        return list()
+
+    return list(tbody.iterchildren("tr"))
+
+
+def _post_historical_data(params):
+    """
+    This is an auxiliar function to send a single historical data request to Investing.com, so
+    that the date intervals of a long historical data retrieval can be requested concurrently.
+
+    Returns:
+        :obj:`requests.Response` - req:
+            The response to the POST request, whose status code is checked by the caller.
+
+    """
+
+    head = {"User-Agent": random_user_agent()}
+
+    url = "https://www.investing.com/instruments/HistoricalDataAjax"
+
+    return _SESSION.post(url, headers=head, data=params, timeout=_TIMEOUT)
+
+
+def _post_historical_data_intervals(params_list):
+    """
+    This is an auxiliar function to send the historical data requests of every date interval, so that long
+    retrievals split into several intervals are requested concurrently, while a single interval is just
+    requested directly. Note that every interval is always requested, since the status codes are just
+    checked, in interval order, once all the responses have been received.
+
+    Returns:
+        :obj:`list` - responses:
+            The :obj:`requests.Response` of every date interval, in the same order as `params_list`.
+
+    Raises:
+        ConnectionError: raised if any POST request does not return 200 status code.
+
+    """
+
+    if len(params_list) == 1:
+        responses = [_post_historical_data(params_list[0])]
+    else:
+        with ThreadPoolExecutor(
+            max_workers=min(len(params_list), _MAX_WORKERS)
+        ) as executor:
+            responses = list(executor.map(_post_historical_data, params_list))
+
+    for req in responses:
+        if req.status_code != 200:
+            raise ConnectionError(
+                "ERR#0015: error " + str(req.status_code) + ", try again later."
+            )
+
+    return responses
+
 
 def get_indices(country=None):
     """
@@ -257,15 +381,7 @@ def get_index_recent_data(
             " 'Daily', 'Weekly' or 'Monthly'."
         )
 
-    resource_package = "investpy"
-    resource_path = "/".join(("resources", "indices.csv"))
-    if pkg_resources.resource_exists(resource_package, resource_path):
-        indices = pd.read_csv(
-            pkg_resources.resource_filename(resource_package, resource_path),
-            keep_default_na=False,
-        )
-    else:
-        raise FileNotFoundError("ERR#0059: indices file not found or errored.")
+    indices, groups = _load_indices_df()
 
     if indices is None:
         raise IOError("ERR#0037: indices not found or unable to retrieve.")
@@ -277,28 +393,24 @@ def get_index_recent_data(
             "ERR#0034: country " + country + " not found, check if it is correct."
         )
 
-    indices = indices[indices["country"] == country]
+    indices = indices.take(groups.get(country, []))
 
     index = unidecode(index.strip().lower())
 
-    if index not in list(indices["name"].apply(unidecode).str.lower()):
+    names = indices["name"].apply(unidecode).str.lower()
+
+    if index not in names.tolist():
         raise RuntimeError(
             "ERR#0045: index " + index + " not found, check if it is correct."
         )
 
-    full_name = indices.loc[
-        (indices["name"].apply(unidecode).str.lower() == index).idxmax(), "full_name"
-    ]
-    id_ = indices.loc[
-        (indices["name"].apply(unidecode).str.lower() == index).idxmax(), "id"
-    ]
-    name = indices.loc[
-        (indices["name"].apply(unidecode).str.lower() == index).idxmax(), "name"
-    ]
+    index_ = (names == index).idxmax()
+
+    full_name = indices.loc[index_, "full_name"]
+    id_ = indices.loc[index_, "id"]
+    name = indices.loc[index_, "name"]
 
-    index_currency = indices.loc[
-        (indices["name"].apply(unidecode).str.lower() == index).idxmax(), "currency"
-    ]
+    index_currency = indices.loc[index_, "currency"]
 
     header = full_name + " Historical Data"
 
@@ -312,38 +424,34 @@ def get_index_recent_data(
         "action": "historical_data",
     }
 
-    head = {
-        "User-Agent": random_user_agent(),
-        "X-Requested-With": "XMLHttpRequest",
-        "Accept": "text/html",
-        "Accept-Encoding": "gzip, deflate",
-        "Connection": "keep-alive",
-    }
+    head = {"User-Agent": random_user_agent()}
 
     url = "https://www.investing.com/instruments/HistoricalDataAjax"
 
-    req = requests.post(url, headers=head, data=params)
+    req = _SESSION.post(url, headers=head, data=params, timeout=_TIMEOUT)
 
     if req.status_code != 200:
         raise ConnectionError(
             "ERR#0015: error " + str(req.status_code) + ", try again later."
         )
 
-    root_ = fromstring(req.text)
-    path_ = root_.xpath(".//table[@id='curr_table']/tbody/tr")
+    root_ = fromstring(req.content, parser=_HTML_PARSER)
+    path_ = _table_rows(root_, "curr_table")
 
     result = list()
 
     if path_:
         for elements_ in path_:
-            if elements_.xpath(".//td")[0].text_content() == "No results found":
+            cells = list(elements_.iterchildren("td"))
+
+            if cells[0].text_content() == "No results found":
                 raise IndexError(
                     "ERR#0046: index information unavailable or not found."
                 )
 
             info = []
 
-            for nested_ in elements_.xpath(".//td"):
+            for nested_ in cells:
                 info.append(nested_.get("data-real-value"))
 
             index_date = datetime.strptime(
@@ -571,15 +679,7 @@ def get_index_historical_data(
 
     data_flag = False
 
-    resource_package = "investpy"
-    resource_path = "/".join(("resources", "indices.csv"))
-    if pkg_resources.resource_exists(resource_package, resource_path):
-        indices = pd.read_csv(
-            pkg_resources.resource_filename(resource_package, resource_path),
-            keep_default_na=False,
-        )
-    else:
-        raise FileNotFoundError("ERR#0059: indices file not found or errored.")
+    indices, groups = _load_indices_df()
 
     if indices is None:
         raise IOError("ERR#0037: indices not found or unable to retrieve.")
@@ -591,76 +691,64 @@ def get_index_historical_data(
             "ERR#0034: country " + country + " not found, check if it is correct."
         )
 
-    indices = indices[indices["country"] == country]
+    indices = indices.take(groups.get(country, []))
 
     index = unidecode(index.strip().lower())
 
-    if index not in list(indices["name"].apply(unidecode).str.lower()):
+    names = indices["name"].apply(unidecode).str.lower()
+
+    if index not in names.tolist():
         raise RuntimeError(
             "ERR#0045: index " + index + " not found, check if it is correct."
         )
 
-    full_name = indices.loc[
-        (indices["name"].apply(unidecode).str.lower() == index).idxmax(), "full_name"
-    ]
-    id_ = indices.loc[
-        (indices["name"].apply(unidecode).str.lower() == index).idxmax(), "id"
-    ]
-    name = indices.loc[
-        (indices["name"].apply(unidecode).str.lower() == index).idxmax(), "name"
-    ]
+    index_ = (names == index).idxmax()
 
-    index_currency = indices.loc[
-        (indices["name"].apply(unidecode).str.lower() == index).idxmax(), "currency"
-    ]
+    full_name = indices.loc[index_, "full_name"]
+    id_ = indices.loc[index_, "id"]
+    name = indices.loc[index_, "name"]
+
+    index_currency = indices.loc[index_, "currency"]
 
     final = list()
 
     header = full_name + " Historical Data"
 
-    for index in range(len(date_interval["intervals"])):
-        interval_counter += 1
-
-        params = {
-            "curr_id": id_,
-            "smlID": str(randint(1000000, 99999999)),
-            "header": header,
-            "st_date": date_interval["intervals"][index]["start"],
-            "end_date": date_interval["intervals"][index]["end"],
-            "interval_sec": interval.capitalize(),
-            "sort_col": "date",
-            "sort_ord": "DESC",
-            "action": "historical_data",
-        }
-
-        head = {
-            "User-Agent": random_user_agent(),
-            "X-Requested-With": "XMLHttpRequest",
-            "Accept": "text/html",
-            "Accept-Encoding": "gzip, deflate",
-            "Connection": "keep-alive",
-        }
-
-        url = "https://www.investing.com/instruments/HistoricalDataAjax"
+    params_list = list()
+
+    for interval_ in date_interval["intervals"]:
+        params_list.append(
+            {
+                "curr_id": id_,
+                "smlID": str(randint(1000000, 99999999)),
+                "header": header,
+                "st_date": interval_["start"],
+                "end_date": interval_["end"],
+                "interval_sec": interval.capitalize(),
+                "sort_col": "date",
+                "sort_ord": "DESC",
+                "action": "historical_data",
+            }
+        )
 
-        req = requests.post(url, headers=head, data=params)
+    responses = _post_historical_data_intervals(params_list)
 
-        if req.status_code != 200:
-            raise ConnectionError(
-                "ERR#0015: error " + str(req.status_code) + ", try again later."
-            )
+    for req in responses:
+        interval_counter += 1
 
-        if not req.text:
+        if not req.content:
             continue
 
-        root_ = fromstring(req.text)
-        path_ = root_.xpath(".//table[@id='curr_table']/tbody/tr")
+        root_ = fromstring(req.content, parser=_HTML_PARSER)
+        path_ = _table_rows(root_, "curr_table")
 
         result = list()
 
         if path_:
             for elements_ in path_:
-                if elements_.xpath(".//td")[0].text_content() == "No results found":
+                cells = list(elements_.iterchildren("td"))
+
+                if cells[0].text_content() == "No results found":
                     if interval_counter < interval_limit:
                         data_flag = False
                     else:
@@ -672,7 +760,7 @@ def get_index_historical_data(
 
                 info = []
 
-                for nested_ in elements_.xpath(".//td"):
+                for nested_ in cells:
                     info.append(nested_.get("data-real-value"))
 
                 if data_flag is True:
@@ -795,15 +883,7 @@ def get_index_information(index, country, as_json=False):
             "ERR#0002: as_json argument can just be True or False, bool type."
         )
 
-    resource_package = "investpy"
-    resource_path = "/".join(("resources", "indices.csv"))
-    if pkg_resources.resource_exists(resource_package, resource_path):
-        indices = pd.read_csv(
-            pkg_resources.resource_filename(resource_package, resource_path),
-            keep_default_na=False,
-        )
-    else:
-        raise FileNotFoundError("ERR#0059: indices file not found or errored.")
+    indices, groups = _load_indices_df()
 
     if indices is None:
         raise IOError("ERR#0037: indices not found or unable to retrieve.")
@@ -815,41 +895,35 @@ def get_index_information(index, country, as_json=False):
             "ERR#0034: country " + country + " not found, check if it is correct."
         )
 
-    indices = indices[indices["country"] == country]
+    indices = indices.take(groups.get(country, []))
 
     index = unidecode(index.strip().lower())
 
-    if index not in list(indices["name"].apply(unidecode).str.lower()):
+    names = indices["name"].apply(unidecode).str.lower()
+
+    if index not in names.tolist():
         raise RuntimeError(
             "ERR#0045: index " + index + " not found, check if it is correct."
         )
 
-    name = indices.loc[
-        (indices["name"].apply(unidecode).str.lower() == index).idxmax(), "name"
-    ]
-    tag = indices.loc[
-        (indices["name"].apply(unidecode).str.lower() == index).idxmax(), "tag"
-    ]
+    index_ = (names == index).idxmax()
+
+    name = indices.loc[index_, "name"]
+    tag = indices.loc[index_, "tag"]
 
     url = "https://www.investing.com/indices/" + tag
 
-    head = {
-        "User-Agent": random_user_agent(),
-        "X-Requested-With": "XMLHttpRequest",
-        "Accept": "text/html",
-        "Accept-Encoding": "gzip, deflate",
-        "Connection": "keep-alive",
-    }
+    head = {"User-Agent": random_user_agent()}
 
-    req = requests.get(url, headers=head)
+    req = _SESSION.get(url, headers=head, timeout=_TIMEOUT)
 
     if req.status_code != 200:
         raise ConnectionError(
             "ERR#0015: error " + str(req.status_code) + ", try again later."
         )
 
-    root_ = fromstring(req.text)
-    path_ = root_.xpath("//dl[@data-test='key-info']/div")
+    root_ = fromstring(req.content, parser=_HTML_PARSER)
+    path_ = _XP_KEY_INFO(root_)
 
     result = pd.DataFrame(
         columns=[
@@ -869,8 +943,8 @@ def get_index_information(index, country, as_json=False):
         raise RuntimeError("ERR#0004: data retrieval error while scraping.")
 
     for elements_ in path_:
-        title_ = elements_.xpath(".//dt")[0].text_content()
-        element = elements_.xpath(".//dd")[0]
+        title_ = elements_.find("dt").text_content()
+        element = elements_.find("dd")
         if title_ in result.columns.tolist():
             try:
                 result.at[0, title_] = float(element.text_content().replace(",", ""))
@@ -887,13 +961,13 @@ def get_index_information(index, country, as_json=False):
                 pass
             try:
                 value = element.text_content().strip()
-                if value.__contains__("K"):
+                if "K" in value:
                     value = float(value.replace("K", "").replace(",", "")) * 1e3
-                elif value.__contains__("M"):
+                elif "M" in value:
                     value = float(value.replace("M", "").replace(",", "")) * 1e6
-                elif value.__contains__("B"):
+                elif "B" in value:
                     value = float(value.replace("B", "").replace(",", "")) * 1e9
-                elif value.__contains__("T"):
+                elif "T" in value:
                     value = float(value.replace("T", "").replace(",", "")) * 1e12
                 result.at[0, title_] = value
                 continue
@@ -966,15 +1040,7 @@ def get_indices_overview(country, as_json=False, n_results=100):
             "ERR#0089: n_results argument should be an integer between 1 and 1000."
         )
 
-    resource_package = "investpy"
-    resource_path = "/".join(("resources", "indices.csv"))
-    if pkg_resources.resource_exists(resource_package, resource_path):
-        indices = pd.read_csv(
-            pkg_resources.resource_filename(resource_package, resource_path),
-            keep_default_na=False,
-        )
-    else:
-        raise FileNotFoundError("ERR#0059: indices file not found or errored.")
+    indices, groups = _load_indices_df()
 
     if indices is None:
         raise IOError("ERR#0037: indices not found or unable to retrieve.")
@@ -986,20 +1052,11 @@ def get_indices_overview(country, as_json=False, n_results=100):
             "ERR#0034: country " + country + " not found, check if it is correct."
         )
 
-    indices = indices[indices["country"] == country]
+    indices = indices.take(groups.get(country, []))
 
-    if country == "united states":
-        country = "usa"
-    elif country == "united kingdom":
-        country = "uk"
+    country = _URL_COUNTRY_ALIASES.get(country, country)
 
-    head = {
-        "User-Agent": random_user_agent(),
-        "X-Requested-With": "XMLHttpRequest",
-        "Accept": "text/html",
-        "Accept-Encoding": "gzip, deflate",
-        "Connection": "keep-alive",
-    }
+    head = {"User-Agent": random_user_agent()}
 
     url = (
         "https://www.investing.com/indices/"
@@ -1007,69 +1064,79 @@ def get_indices_overview(country, as_json=False, n_results=100):
         + "-indices?&majorIndices=on&primarySectors=on&additionalIndices=on&otherIndices=on"
     )
 
-    req = requests.get(url, headers=head)
+    req = _SESSION.get(url, headers=head, timeout=_TIMEOUT)
 
     if req.status_code != 200:
         raise ConnectionError(
             "ERR#0015: error " + str(req.status_code) + ", try again later."
         )
 
-    root_ = fromstring(req.text)
-    table = root_.xpath(".//table[@id='cr1']/tbody/tr")
+    root_ = fromstring(req.content, parser=_HTML_PARSER)
+    table = _table_rows(root_, "cr1")
 
-    results = list()
+    countries = list()
+    names = list()
+    lasts = list()
+    highs = list()
+    lows = list()
+    changes = list()
+    change_percentages = list()
+    currencies = list()
 
     if len(table) > 0:
-        for row in table[:n_results]:
-            id_ = row.get("id").replace("pair_", "")
-            country_check = (
-                row.xpath(".//td[@class='flag']/span")[0].get("title").lower()
-            )
+        currency_by_name = (
+            indices.drop_duplicates(subset="name")
+            .set_index("name")["currency"]
+            .to_dict()
+        )
+        default_currency = indices["currency"].iloc[0]
 
-            if country_check == "bosnia-herzegovina":
-                country_check = "bosnia"
-            elif country_check == "palestinian territory":
-                country_check = "palestine"
-            elif country_check == "united arab emirates":
-                country_check = "dubai"
-            elif country_check == "cote d'ivoire":
-                country_check = "ivory coast"
-
-            name = (
-                row.xpath(".//td[contains(@class, 'elp')]/a")[0].text_content().strip()
-            )
+        for row in table[:n_results]:
+            id_ = row.get("id")
+            if id_.startswith(_PAIR_PREFIX):
+                id_ = id_[_PAIR_PREFIX_LEN:]
 
-            pid = "pid-" + id_
+            cells = {td.get("class"): td for td in row.iterchildren("td")}
 
-            last = row.xpath(".//td[@class='" + pid + "-last']")[0].text_content()
-            high = row.xpath(".//td[@class='" + pid + "-high']")[0].text_content()
-            low = row.xpath(".//td[@class='" + pid + "-low']")[0].text_content()
+            country_check = cells["flag"].find("span").get("title").lower()
+            country_check = _FLAG_COUNTRY_ALIASES.get(country_check, country_check)
 
-            pc = row.xpath(".//td[contains(@class, '" + pid + "-pc')]")[
-                0
-            ].text_content()
-            pcp = row.xpath(".//td[contains(@class, '" + pid + "-pcp')]")[
-                0
-            ].text_content()
+            name = _XP_NAME(row)[0].text_content().strip()
 
-            data = {
-                "country": country_check,
-                "name": name,
-                "last": float(last.replace(",", "")),
-                "high": float(high.replace(",", "")),
-                "low": float(low.replace(",", "")),
-                "change": pc,
-                "change_percentage": pcp,
-                "currency": indices.loc[(indices["name"] == name).idxmax(), "currency"],
-            }
+            pid = "pid-" + id_
 
-            results.append(data)
+            last = cells[pid + "-last"].text_content()
+            high = cells[pid + "-high"].text_content()
+            low = cells[pid + "-low"].text_content()
+
+            pc = _XP_TD_CLASS_CONTAINS(row, name=pid + "-pc")[0].text_content()
+            pcp = _XP_TD_CLASS_CONTAINS(row, name=pid + "-pcp")[0].text_content()
+
+            countries.append(country_check)
+            names.append(name)
+            lasts.append(float(last.replace(",", "")))
+            highs.append(float(high.replace(",", "")))
+            lows.append(float(low.replace(",", "")))
+            changes.append(pc)
+            change_percentages.append(pcp)
+            currencies.append(currency_by_name.get(name, default_currency))
     else:
         raise RuntimeError(
             "ERR#0092: no data found while retrieving the overview from Investing.com"
         )
 
-    df = pd.DataFrame(results)
+    df = pd.DataFrame(
+        {
+            "country": countries,
+            "name": names,
+            "last": lasts,
+            "high": highs,
+            "low": lows,
+            "change": changes,
+            "change_percentage": change_percentages,
+            "currency": currencies,
+        }
+    )
 
     if as_json:
         return json.loads(df.to_json(orient="records"))
@@ -1121,20 +1188,12 @@ def search_indices(by, value):
             "ERR#0017: the introduced value to search is mandatory and should be a str."
         )
 
-    resource_package = "investpy"
-    resource_path = "/".join(("resources", "indices.csv"))
-    if pkg_resources.resource_exists(resource_package, resource_path):
-        indices = pd.read_csv(
-            pkg_resources.resource_filename(resource_package, resource_path),
-            keep_default_na=False,
-        )
-    else:
-        raise FileNotFoundError("ERR#0059: indices file not found or errored.")
+    indices, _ = _load_indices_df()
 
     if indices is None:
         raise IOError("ERR#0037: indices not found or unable to retrieve.")
 
-    indices.drop(columns=["tag", "id"], inplace=True)
+    indices = indices.drop(columns=["tag", "id"])
 
     available_search_fields = indices.columns.tolist()
 
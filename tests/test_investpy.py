@@ -1,6 +1,10 @@
 # Copyright 2018-2021 Alvaro Bartolome, alvarobartt @ GitHub
 # See LICENSE for details.
 
+import time
+from datetime import datetime
+from types import SimpleNamespace
+
 import pytest
 
 import investpy
@@ -591,6 +595,108 @@ def test_investpy_indices():
     investpy.search_indices(by='name', value='ibex')
 
 
+def test_investpy_indices_data():
+    """
+    This function checks that index listing functions listed in investpy work properly, even for countries
+    without indices and when the cached `indices.csv` data is modified by the caller.
+    """
+
+    columns = ['country', 'name', 'full_name', 'symbol', 'currency', 'class', 'market']
+
+    for country in ['luxembourg', 'palestinian territory', 'malawi']:
+        indices = investpy.get_indices(country=country)
+
+        assert indices.empty
+        assert indices.columns.tolist() == columns
+
+        assert investpy.get_indices_list(country=country) == []
+        assert investpy.get_indices_dict(country=country) == []
+        assert investpy.get_indices_dict(country=country, as_json=True) == '[]'
+
+    for country in ['spain', None]:
+        indices = investpy.get_indices(country=country)
+        expected = indices.copy()
+
+        indices.drop(columns=['symbol'], inplace=True)
+        indices.loc[0, 'name'] = None
+
+        assert investpy.get_indices(country=country).equals(expected)
+
+
+def test_investpy_indices_historical_intervals(monkeypatch):
+    """
+    This function checks that the historical data of every date interval is properly requested and merged in order,
+    without requesting Investing.com, so that the concurrent retrieval of long date ranges can be checked offline.
+    """
+
+    posts = list()
+
+    def post(url, headers, data, timeout):
+        posts.append(data)
+
+        start = datetime.strptime(data['st_date'], '%m/%d/%Y')
+        timestamp = int((start - datetime(1970, 1, 1)).total_seconds())
+
+        # later intervals answer first, so that the order has to be kept by investpy
+        time.sleep(0.1 / len(posts))
+
+        content = (
+            "<html><body><table id='curr_table'><tbody><tr>"
+            + "".join(
+                "<td data-real-value='" + value + "'></td>"
+                for value in [str(timestamp), '2.0', '1.0', '3.0', '0.5', '100']
+            )
+            + "</tr></tbody></table></body></html>"
+        ).encode()
+
+        return SimpleNamespace(status_code=200, content=content)
+
+    monkeypatch.setattr(investpy.indices._SESSION, 'post', post)
+
+    data = investpy.get_index_historical_data(
+        index='ibex 35', country='spain', from_date='01/01/1960', to_date='01/01/2020'
+    )
+
+    assert len(posts) == 4
+    assert data.index.tolist() == sorted(data.index.tolist())
+    assert [date.year for date in data.index] == [1960, 1979, 1998, 2017]
+
+    def failed_post(url, headers, data, timeout):
+        posts.append(data)
+
+        return SimpleNamespace(status_code=500, content=b'')
+
+    monkeypatch.setattr(investpy.indices._SESSION, 'post', failed_post)
+
+    with pytest.raises(ConnectionError, match='ERR#0015'):
+        investpy.get_index_historical_data(
+            index='ibex 35', country='spain', from_date='01/01/1960', to_date='01/01/2020'
+        )
+
+    monkeypatch.setattr(investpy.indices._SESSION, 'post', post)
+
+    def executor(*args, **kwargs):
+        raise AssertionError('a single date interval should not use a thread pool')
+
+    monkeypatch.setattr(investpy.indices, 'ThreadPoolExecutor', executor)
+
+    posts.clear()
+
+    data = investpy.get_index_historical_data(
+        index='ibex 35', country='spain', from_date='01/01/2010', to_date='01/01/2020'
+    )
+
+    assert len(posts) == 1
+    assert len(data) == 1
+
+    monkeypatch.setattr(investpy.indices._SESSION, 'post', failed_post)
+
+    with pytest.raises(ConnectionError, match='ERR#0015'):
+        investpy.get_index_historical_data(
+            index='ibex 35', country='spain', from_date='01/01/2010', to_date='01/01/2020'
+        )
+
+
 def test_investpy_currency_crosses():
     """
     This function checks that currency cross data retrieval functions listed in investpy work properly.